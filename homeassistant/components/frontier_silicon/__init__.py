@@ -11,14 +11,18 @@ from homeassistant.const import CONF_PIN, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import CONF_WEBFSAPI_URL, DOMAIN
+from .const import CONF_WEBFSAPI_URL
 
 PLATFORMS = [Platform.MEDIA_PLAYER]
 
+type FrontierSiliconConfigEntry = ConfigEntry[AFSAPI]
+
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(
+    hass: HomeAssistant, entry: FrontierSiliconConfigEntry
+) -> bool:
     """Set up Frontier Silicon from a config entry."""
 
     webfsapi_url = entry.data[CONF_WEBFSAPI_URL]
@@ -31,16 +35,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except FSConnectionError as exception:
         raise ConfigEntryNotReady from exception
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = afsapi
+    entry.runtime_data = afsapi
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(
+    hass: HomeAssistant, entry: FrontierSiliconConfigEntry
+) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
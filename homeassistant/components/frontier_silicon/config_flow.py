@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
 import logging
-from typing import Any
+from typing import Any, Self
 from urllib.parse import urlparse
 
 from afsapi import (
@@ -18,6 +19,8 @@ import voluptuous as vol
 from homeassistant.components import ssdp
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_HOST, CONF_PIN, CONF_PORT
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
 
 from .const import (
     CONF_WEBFSAPI_URL,
@@ -29,6 +32,16 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_WEBFSAPI_ENDPOINT_CACHE: HassKey[dict[str, tuple[float, str]]] = HassKey(
+    f"{DOMAIN}_webfsapi_endpoint_cache"
+)
+_WEBFSAPI_ENDPOINT_REQUESTS: HassKey[dict[str, asyncio.Task[str]]] = HassKey(
+    f"{DOMAIN}_webfsapi_endpoint_requests"
+)
+# Radios keep announcing themselves, but their webfsapi endpoint practically
+# never changes, so remember it for a while instead of asking again.
+_WEBFSAPI_ENDPOINT_CACHE_TTL = 300
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -51,6 +64,55 @@ def hostname_from_url(url: str) -> str:
     return str(urlparse(url).hostname)
 
 
+def device_url_from_host(host: str, port: int) -> str:
+    """Return the url of the device description for a host and port."""
+    if ":" in host and not host.startswith("["):
+        # IPv6 addresses have to be enclosed in brackets
+        host = f"[{host}]"
+    return f"http://{host}:{port}/device"
+
+
+async def _async_get_webfsapi_endpoint(hass: HomeAssistant, device_url: str) -> str:
+    """Return the webfsapi endpoint of a device.
+
+    Successful lookups are cached for a short while and concurrent lookups for
+    the same device url share a single request. The request is shielded, so a
+    cancelled flow does not abort a lookup other flows are still waiting for.
+    """
+    cache = hass.data.setdefault(_WEBFSAPI_ENDPOINT_CACHE, {})
+    if (cached := cache.get(device_url)) is not None:
+        fetched_at, webfsapi_url = cached
+        if hass.loop.time() - fetched_at < _WEBFSAPI_ENDPOINT_CACHE_TTL:
+            return webfsapi_url
+        del cache[device_url]
+
+    requests = hass.data.setdefault(_WEBFSAPI_ENDPOINT_REQUESTS, {})
+    if (request := requests.get(device_url)) is None:
+        # Not started eagerly, so the request is registered before it can finish
+        request = requests[device_url] = hass.async_create_task(
+            _async_request_webfsapi_endpoint(hass, device_url),
+            f"{DOMAIN} webfsapi endpoint lookup {device_url}",
+            eager_start=False,
+        )
+    return await asyncio.shield(request)
+
+
+@callback
+def _async_forget_webfsapi_endpoint(hass: HomeAssistant, device_url: str) -> None:
+    """Forget the cached webfsapi endpoint of a device that stopped responding."""
+    hass.data.get(_WEBFSAPI_ENDPOINT_CACHE, {}).pop(device_url, None)
+
+
+async def _async_request_webfsapi_endpoint(hass: HomeAssistant, device_url: str) -> str:
+    """Request the webfsapi endpoint of a device and cache it."""
+    try:
+        webfsapi_url = await AFSAPI.get_webfsapi_endpoint(device_url)
+    finally:
+        hass.data[_WEBFSAPI_ENDPOINT_REQUESTS].pop(device_url, None)
+    hass.data[_WEBFSAPI_ENDPOINT_CACHE][device_url] = (hass.loop.time(), webfsapi_url)
+    return webfsapi_url
+
+
 class FrontierSiliconConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Frontier Silicon Media Player."""
 
@@ -58,6 +120,7 @@ class FrontierSiliconConfigFlow(ConfigFlow, domain=DOMAIN):
 
     _name: str
     _webfsapi_url: str
+    _device_hostname: str | None = None  # Only used in SSDP flows
     _reauth_entry: ConfigEntry | None = None  # Only used in reauth flows
 
     async def async_step_user(
@@ -67,22 +130,30 @@ class FrontierSiliconConfigFlow(ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input:
-            device_url = (
-                f"http://{user_input[CONF_HOST]}:{user_input[CONF_PORT]}/device"
+            device_url = device_url_from_host(
+                user_input[CONF_HOST], user_input[CONF_PORT]
             )
             try:
-                self._webfsapi_url = await AFSAPI.get_webfsapi_endpoint(device_url)
+                self._webfsapi_url = await _async_get_webfsapi_endpoint(
+                    self.hass, device_url
+                )
             except FSConnectionError:
                 errors["base"] = "cannot_connect"
             except Exception:
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                return await self._async_step_device_config_if_needed()
-
-        data_schema = self.add_suggested_values_to_schema(
-            STEP_USER_DATA_SCHEMA, user_input
-        )
+                try:
+                    return await self._async_step_device_config_if_needed()
+                except FSConnectionError:
+                    # The endpoint may have been cached before the radio went offline
+                    _async_forget_webfsapi_endpoint(self.hass, device_url)
+                    errors["base"] = "cannot_connect"
+
+        data_schema = STEP_USER_DATA_SCHEMA
+        if user_input:
+            # Only copy the schema when there are values to suggest
+            data_schema = self.add_suggested_values_to_schema(data_schema, user_input)
         return self.async_show_form(
             step_id="user", data_schema=data_schema, errors=errors
         )
@@ -96,17 +167,23 @@ class FrontierSiliconConfigFlow(ConfigFlow, domain=DOMAIN):
         if device_url is None:
             return self.async_abort(reason="cannot_connect")
 
-        device_hostname = hostname_from_url(device_url)
+        self._device_hostname = device_hostname = hostname_from_url(device_url)
         for entry in self._async_current_entries(include_ignore=False):
             if device_hostname == hostname_from_url(entry.data[CONF_WEBFSAPI_URL]):
                 return self.async_abort(reason="already_configured")
 
+        # Abort before talking to the device if it is already being discovered
+        if self.hass.config_entries.flow.async_has_matching_flow(self):
+            return self.async_abort(reason="already_in_progress")
+
         if speaker_name := discovery_info.ssdp_headers.get(SSDP_ATTR_SPEAKER_NAME):
             # If we have a name, use it as flow title
             self.context["title_placeholders"] = {"name": speaker_name}
 
         try:
-            self._webfsapi_url = await AFSAPI.get_webfsapi_endpoint(device_url)
+            self._webfsapi_url = await _async_get_webfsapi_endpoint(
+                self.hass, device_url
+            )
         except FSConnectionError:
             return self.async_abort(reason="cannot_connect")
         except Exception as exception:  # noqa: BLE001
@@ -116,7 +193,11 @@ class FrontierSiliconConfigFlow(ConfigFlow, domain=DOMAIN):
         # try to login with default pin
         afsapi = AFSAPI(self._webfsapi_url, DEFAULT_PIN)
         try:
-            await afsapi.get_friendly_name()
+            self._name = await afsapi.get_friendly_name()
+        except FSConnectionError:
+            # The endpoint may have been cached before the radio went offline
+            _async_forget_webfsapi_endpoint(self.hass, device_url)
+            return self.async_abort(reason="cannot_connect")
         except InvalidPinException:
             return self.async_abort(reason="invalid_auth")
 
@@ -130,10 +211,15 @@ class FrontierSiliconConfigFlow(ConfigFlow, domain=DOMAIN):
             updates={CONF_WEBFSAPI_URL: self._webfsapi_url}, reload_on_update=True
         )
 
-        self._name = await afsapi.get_friendly_name()
-
         return await self.async_step_confirm()
 
+    def is_matching(self, other_flow: Self) -> bool:
+        """Return True if other_flow is matching this flow."""
+        return (
+            self._device_hostname is not None
+            and other_flow._device_hostname == self._device_hostname  # noqa: SLF001
+        )
+
     async def _async_step_device_config_if_needed(self) -> ConfigFlowResult:
         """Most users will not have changed the default PIN on their radio.
 
@@ -20,25 +20,39 @@ from homeassistant.components.media_player import (
     MediaPlayerState,
     MediaType,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import FrontierSiliconConfigEntry
 from .browse_media import browse_node, browse_top_level
 from .const import DOMAIN, MEDIA_CONTENT_ID_PRESET
 
 _LOGGER = logging.getLogger(__name__)
 
+# The web server of the radios does not cope well with concurrent requests
+PARALLEL_UPDATES = 1
+
+# The mode rarely changes, so only ask the radio for it every this many updates
+MODE_REFRESH_INTERVAL = 4
+
+PLAY_STATE_TO_MEDIA_PLAYER_STATE = {
+    PlayState.PLAYING: MediaPlayerState.PLAYING,
+    PlayState.PAUSED: MediaPlayerState.PAUSED,
+    PlayState.STOPPED: MediaPlayerState.IDLE,
+    PlayState.LOADING: MediaPlayerState.BUFFERING,
+    None: MediaPlayerState.IDLE,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: FrontierSiliconConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Frontier Silicon entity."""
 
-    afsapi: AFSAPI = hass.data[DOMAIN][config_entry.entry_id]
+    afsapi = config_entry.runtime_data
 
     async_add_entities(
         [
@@ -92,6 +106,7 @@ class AFSAPIDevice(MediaPlayerEntity):
         self.__sound_modes_by_label: dict[str, str] | None = None
 
         self._supports_sound_mode: bool = True
+        self._mode_refresh_countdown = 0
 
     async def async_update(self) -> None:
         """Get the latest date and update device state."""
@@ -99,13 +114,7 @@ class AFSAPIDevice(MediaPlayerEntity):
         try:
             if await afsapi.get_power():
                 status = await afsapi.get_play_status()
-                self._attr_state = {
-                    PlayState.PLAYING: MediaPlayerState.PLAYING,
-                    PlayState.PAUSED: MediaPlayerState.PAUSED,
-                    PlayState.STOPPED: MediaPlayerState.IDLE,
-                    PlayState.LOADING: MediaPlayerState.BUFFERING,
-                    None: MediaPlayerState.IDLE,
-                }.get(status)
+                self._attr_state = PLAY_STATE_TO_MEDIA_PLAYER_STATE.get(status)
             else:
                 self._attr_state = MediaPlayerState.OFF
         except FSConnectionError:
@@ -161,8 +170,11 @@ class AFSAPIDevice(MediaPlayerEntity):
             self._attr_media_artist = await afsapi.get_play_artist()
             self._attr_media_album_name = await afsapi.get_play_album()
 
-            radio_mode = await afsapi.get_mode()
-            self._attr_source = radio_mode.label if radio_mode is not None else None
+            if self._attr_source is None or self._mode_refresh_countdown <= 0:
+                radio_mode = await afsapi.get_mode()
+                self._attr_source = radio_mode.label if radio_mode is not None else None
+                self._mode_refresh_countdown = MODE_REFRESH_INTERVAL
+            self._mode_refresh_countdown -= 1
 
             self._attr_is_volume_muted = await afsapi.get_mute()
             self._attr_media_image_url = await afsapi.get_play_graphic()
@@ -240,17 +252,32 @@ class AFSAPIDevice(MediaPlayerEntity):
         await self.fs_device.set_mute(mute)
 
     # volume
+    async def _async_get_volume(self, max_volume: int) -> int:
+        """Return the current volume, only asking the radio if it is not known."""
+        if self._attr_volume_level is None:
+            return int(await self.fs_device.get_volume() or 0)
+        return round(self._attr_volume_level * max_volume)
+
+    async def _async_set_volume(self, volume: int, max_volume: int) -> None:
+        """Set the volume and keep track of it until the next update."""
+        await self.fs_device.set_volume(volume)
+        self._attr_volume_level = volume / max_volume
+
     async def async_volume_up(self) -> None:
         """Send volume up command."""
-        volume = await self.fs_device.get_volume()
-        volume = int(volume or 0) + 1
-        await self.fs_device.set_volume(min(volume, self._max_volume))
+        if not (max_volume := self._max_volume):
+            # Can't do anything sensible if the max volume is not known yet
+            return
+        volume = await self._async_get_volume(max_volume) + 1
+        await self._async_set_volume(min(volume, max_volume), max_volume)
 
     async def async_volume_down(self) -> None:
         """Send volume down command."""
-        volume = await self.fs_device.get_volume()
-        volume = int(volume or 0) - 1
-        await self.fs_device.set_volume(max(volume, 0))
+        if not (max_volume := self._max_volume):
+            # Can't do anything sensible if the max volume is not known yet
+            return
+        volume = await self._async_get_volume(max_volume) - 1
+        await self._async_set_volume(max(volume, 0), max_volume)
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume command."""
@@ -266,6 +293,8 @@ class AFSAPIDevice(MediaPlayerEntity):
             and (mode := self.__modes_by_label.get(source)) is not None
         ):
             await self.fs_device.set_mode(mode)
+            self._attr_source = source
+            self._mode_refresh_countdown = MODE_REFRESH_INTERVAL
 
     async def async_select_sound_mode(self, sound_mode: str) -> None:
         """Select EQ Preset."""
@@ -312,5 +341,4 @@ class AFSAPIDevice(MediaPlayerEntity):
         else:
             await self.fs_device.nav_select_item_via_path(keys)
 
-        await self.async_update()
         self._attr_media_content_id = media_id
@@ -43,37 +43,47 @@ KEY_WLAN_HOST_LIST = "wlan_host_list"
 KEY_WLAN_WIFI_FEATURE_SWITCH = "wlan_wifi_feature_switch"
 KEY_WLAN_WIFI_GUEST_NETWORK_SWITCH = "wlan_wifi_guest_network_switch"
 
-BINARY_SENSOR_KEYS = {
-    KEY_MONITORING_CHECK_NOTIFICATIONS,
-    KEY_MONITORING_STATUS,
-    KEY_WLAN_WIFI_FEATURE_SWITCH,
-}
+BINARY_SENSOR_KEYS = frozenset(
+    {
+        KEY_MONITORING_CHECK_NOTIFICATIONS,
+        KEY_MONITORING_STATUS,
+        KEY_WLAN_WIFI_FEATURE_SWITCH,
+    }
+)
 
-DEVICE_TRACKER_KEYS = {
-    KEY_LAN_HOST_INFO,
-    KEY_WLAN_HOST_LIST,
-}
+DEVICE_TRACKER_KEYS = frozenset(
+    {
+        KEY_LAN_HOST_INFO,
+        KEY_WLAN_HOST_LIST,
+    }
+)
 
-SENSOR_KEYS = {
-    KEY_DEVICE_INFORMATION,
-    KEY_DEVICE_SIGNAL,
-    KEY_MONITORING_CHECK_NOTIFICATIONS,
-    KEY_MONITORING_MONTH_STATISTICS,
-    KEY_MONITORING_STATUS,
-    KEY_MONITORING_TRAFFIC_STATISTICS,
-    KEY_NET_CURRENT_PLMN,
-    KEY_NET_NET_MODE,
-    KEY_SMS_SMS_COUNT,
-}
+SENSOR_KEYS = frozenset(
+    {
+        KEY_DEVICE_INFORMATION,
+        KEY_DEVICE_SIGNAL,
+        KEY_MONITORING_CHECK_NOTIFICATIONS,
+        KEY_MONITORING_MONTH_STATISTICS,
+        KEY_MONITORING_STATUS,
+        KEY_MONITORING_TRAFFIC_STATISTICS,
+        KEY_NET_CURRENT_PLMN,
+        KEY_NET_NET_MODE,
+        KEY_SMS_SMS_COUNT,
+    }
+)
 
-SWITCH_KEYS = {KEY_DIALUP_MOBILE_DATASWITCH, KEY_WLAN_WIFI_GUEST_NETWORK_SWITCH}
+SWITCH_KEYS = frozenset(
+    {KEY_DIALUP_MOBILE_DATASWITCH, KEY_WLAN_WIFI_GUEST_NETWORK_SWITCH}
+)
 
-ALL_KEYS = (
-    BINARY_SENSOR_KEYS
-    | DEVICE_TRACKER_KEYS
-    | SENSOR_KEYS
-    | SWITCH_KEYS
-    | {KEY_DEVICE_BASIC_INFORMATION}
+ALL_KEYS = frozenset(
+    {
+        *BINARY_SENSOR_KEYS,
+        *DEVICE_TRACKER_KEYS,
+        *SENSOR_KEYS,
+        *SWITCH_KEYS,
+        KEY_DEVICE_BASIC_INFORMATION,
+    }
 )
 
 BUTTON_KEY_CLEAR_TRAFFIC_STATISTICS = "clear_traffic_statistics"
@@ -8,15 +8,16 @@ from .serializer import format_python_namespace
 
 def generate_and_validate(integrations: dict[str, Integration]) -> str:
     """Validate and generate bluetooth data."""
-    match_list = []
-
-    for domain in sorted(integrations):
-        match_types = integrations[domain].manifest.get("bluetooth", [])
-
-        if not match_types:
-            continue
-
-        match_list.extend({"domain": domain, **entry} for entry in match_types)
+    bluetooth_integrations = [
+        (domain, match_types)
+        for domain, integration in integrations.items()
+        if (match_types := integration.manifest.get("bluetooth"))
+    ]
+    match_list = [
+        {"domain": domain, **entry}
+        for domain, match_types in sorted(bluetooth_integrations)
+        for entry in match_types
+    ]
 
     return format_python_namespace(
         {"BLUETOOTH": match_list},
@@ -45,4 +46,4 @@ def validate(integrations: dict[str, Integration], config: Config) -> None:
 def generate(integrations: dict[str, Integration], config: Config) -> None:
     """Generate bluetooth file."""
     bluetooth_path = config.root / "homeassistant/generated/bluetooth.py"
-    bluetooth_path.write_text(f"{config.cache['bluetooth']}")
+    bluetooth_path.write_text(config.cache["bluetooth"])
@@ -1,8 +1,11 @@
 """Test the Frontier Silicon config flow."""
 
+import asyncio
+import dataclasses
 from unittest.mock import AsyncMock, patch
 
 from afsapi import ConnectionError, InvalidPinException, NotImplementedException
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import config_entries
@@ -20,6 +23,8 @@ from tests.common import MockConfigEntry
 
 pytestmark = pytest.mark.usefixtures("mock_setup_entry")
 
+DEVICE_URL = "http://1.1.1.1:80/device"
+WEBFSAPI_URL = "http://1.1.1.1:80/webfsapi"
 
 MOCK_DISCOVERY = ssdp.SsdpServiceInfo(
     ssdp_usn="mock_usn",
@@ -104,7 +109,6 @@ async def test_form_nondefault_pin(
             result["flow_id"],
             {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
         )
-        await hass.async_block_till_done()
 
     assert result2["type"] is FlowResultType.FORM
     assert result2["step_id"] == "device_config"
@@ -160,7 +164,6 @@ async def test_form_nondefault_pin_invalid(
             result["flow_id"],
             {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
         )
-        await hass.async_block_till_done()
 
     assert result2["type"] is FlowResultType.FORM
     assert result2["step_id"] == "device_config"
@@ -174,7 +177,6 @@ async def test_form_nondefault_pin_invalid(
             result2["flow_id"],
             {CONF_PIN: "4321"},
         )
-        await hass.async_block_till_done()
 
     assert result3["type"] is FlowResultType.FORM
     assert result2["step_id"] == "device_config"
@@ -218,23 +220,25 @@ async def test_invalid_device_url(
 
     with patch(
         "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_webfsapi_endpoint",
-        side_effect=webfsapi_endpoint_error,
-    ):
+        side_effect=[webfsapi_endpoint_error, WEBFSAPI_URL],
+    ) as mock_get_webfsapi_endpoint:
         result2 = await hass.config_entries.flow.async_configure(
             result["flow_id"],
             {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
         )
-        await hass.async_block_till_done()
 
-    assert result2["type"] is FlowResultType.FORM
-    assert result2["step_id"] == "user"
-    assert result2["errors"] == {"base": result_error}
+        assert result2["type"] is FlowResultType.FORM
+        assert result2["step_id"] == "user"
+        assert result2["errors"] == {"base": result_error}
 
-    result3 = await hass.config_entries.flow.async_configure(
-        result2["flow_id"],
-        {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
-    )
-    await hass.async_block_till_done()
+        # The retry must look the endpoint up again instead of reusing the error
+        result3 = await hass.config_entries.flow.async_configure(
+            result2["flow_id"],
+            {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
+        )
+        await hass.async_block_till_done()
+
+    assert mock_get_webfsapi_endpoint.call_count == 2
 
     assert result3["type"] is FlowResultType.CREATE_ENTRY
     assert result3["title"] == "Name of the device"
@@ -245,6 +249,199 @@ async def test_invalid_device_url(
     mock_setup_entry.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    ("host", "device_url"),
+    [
+        ("1.1.1.1", "http://1.1.1.1:80/device"),
+        ("radio.local", "http://radio.local:80/device"),
+        ("fe80::1", "http://[fe80::1]:80/device"),
+        ("[fe80::1]", "http://[fe80::1]:80/device"),
+    ],
+)
+async def test_form_device_url(hass: HomeAssistant, host: str, device_url: str) -> None:
+    """Test the device url is built from the user provided host and port."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with patch(
+        "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_webfsapi_endpoint",
+        return_value="http://1.1.1.1:80/webfsapi",
+    ) as mock_get_webfsapi_endpoint:
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_HOST: host, CONF_PORT: 80},
+        )
+
+    assert result2["type"] is FlowResultType.CREATE_ENTRY
+    mock_get_webfsapi_endpoint.assert_called_once_with(device_url)
+
+
+async def test_webfsapi_endpoint_lookup_shared(hass: HomeAssistant) -> None:
+    """Test a user flow and a discovery of the same device share one lookup."""
+    lookup_done = asyncio.Event()
+
+    async def _get_webfsapi_endpoint(device_url: str) -> str:
+        await lookup_done.wait()
+        return WEBFSAPI_URL
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with (
+        patch(
+            "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_webfsapi_endpoint",
+            side_effect=_get_webfsapi_endpoint,
+        ) as mock_get_webfsapi_endpoint,
+        patch(
+            "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_radio_id",
+            side_effect=NotImplementedException,
+        ),
+    ):
+        discovery = hass.async_create_task(
+            hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": config_entries.SOURCE_SSDP},
+                data=dataclasses.replace(MOCK_DISCOVERY, ssdp_location=DEVICE_URL),
+            )
+        )
+        user = hass.async_create_task(
+            hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
+            )
+        )
+        lookup_done.set()
+
+        result2 = await discovery
+        result3 = await user
+        await hass.async_block_till_done()
+
+    assert result2["type"] is FlowResultType.FORM
+    assert result2["step_id"] == "confirm"
+    assert result3["type"] is FlowResultType.CREATE_ENTRY
+    mock_get_webfsapi_endpoint.assert_called_once_with(DEVICE_URL)
+
+
+async def test_webfsapi_endpoint_lookup_flow_cancelled(hass: HomeAssistant) -> None:
+    """Test cancelling one flow leaves the shared lookup running for the other."""
+    lookup_done = asyncio.Event()
+
+    async def _get_webfsapi_endpoint(device_url: str) -> str:
+        await lookup_done.wait()
+        return WEBFSAPI_URL
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with patch(
+        "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_webfsapi_endpoint",
+        side_effect=_get_webfsapi_endpoint,
+    ) as mock_get_webfsapi_endpoint:
+        user = hass.async_create_task(
+            hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
+            )
+        )
+        discovery = hass.async_create_task(
+            hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": config_entries.SOURCE_SSDP},
+                data=dataclasses.replace(MOCK_DISCOVERY, ssdp_location=DEVICE_URL),
+            )
+        )
+
+        user.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await user
+
+        lookup_done.set()
+        result2 = await discovery
+
+    assert result2["type"] is FlowResultType.FORM
+    assert result2["step_id"] == "confirm"
+    mock_get_webfsapi_endpoint.assert_called_once_with(DEVICE_URL)
+
+
+async def test_webfsapi_endpoint_lookup_cached(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a looked up endpoint is reused by later flows until it expires."""
+    with patch(
+        "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_webfsapi_endpoint",
+        return_value=WEBFSAPI_URL,
+    ) as mock_get_webfsapi_endpoint:
+        for _ in range(2):
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": config_entries.SOURCE_USER}
+            )
+            with patch(
+                "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_friendly_name",
+                side_effect=InvalidPinException,
+            ):
+                result2 = await hass.config_entries.flow.async_configure(
+                    result["flow_id"],
+                    {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
+                )
+            assert result2["type"] is FlowResultType.FORM
+            assert result2["step_id"] == "device_config"
+
+        mock_get_webfsapi_endpoint.assert_called_once_with(DEVICE_URL)
+
+        freezer.tick(301)
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
+        )
+        await hass.async_block_till_done()
+
+    assert result2["type"] is FlowResultType.CREATE_ENTRY
+    assert mock_get_webfsapi_endpoint.call_count == 2
+
+
+async def test_form_cached_device_unreachable(
+    hass: HomeAssistant, mock_setup_entry: AsyncMock
+) -> None:
+    """Test the user step handles a radio going offline after its endpoint lookup."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with patch(
+        "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_webfsapi_endpoint",
+        return_value=WEBFSAPI_URL,
+    ) as mock_get_webfsapi_endpoint:
+        with patch(
+            "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_friendly_name",
+            side_effect=ConnectionError,
+        ):
+            result2 = await hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
+            )
+
+        assert result2["type"] is FlowResultType.FORM
+        assert result2["step_id"] == "user"
+        assert result2["errors"] == {"base": "cannot_connect"}
+
+        # The cached endpoint was dropped, so the retry looks it up again
+        result3 = await hass.config_entries.flow.async_configure(
+            result2["flow_id"],
+            {CONF_HOST: "1.1.1.1", CONF_PORT: 80},
+        )
+        await hass.async_block_till_done()
+
+    assert result3["type"] is FlowResultType.CREATE_ENTRY
+    assert mock_get_webfsapi_endpoint.call_count == 2
+    mock_setup_entry.assert_called_once()
+
+
 @pytest.mark.parametrize(
     ("radio_id_return_value", "radio_id_side_effect"),
     [("mock_radio_id", None), (None, NotImplementedException)],
@@ -319,6 +516,42 @@ async def test_ssdp_already_configured(
     assert result["reason"] == "already_configured"
 
 
+async def test_ssdp_already_in_progress(hass: HomeAssistant) -> None:
+    """Test a device without radio id being discovered while already in progress."""
+    with patch(
+        "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_radio_id",
+        side_effect=NotImplementedException,
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": config_entries.SOURCE_SSDP},
+            data=MOCK_DISCOVERY,
+        )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "confirm"
+
+    with (
+        patch(
+            "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_friendly_name",
+        ) as mock_get_friendly_name,
+        patch(
+            "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_radio_id",
+            side_effect=NotImplementedException,
+        ) as mock_get_radio_id,
+    ):
+        result2 = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": config_entries.SOURCE_SSDP},
+            data=MOCK_DISCOVERY,
+        )
+
+    assert result2["type"] is FlowResultType.ABORT
+    assert result2["reason"] == "already_in_progress"
+    mock_get_friendly_name.assert_not_awaited()
+    mock_get_radio_id.assert_not_awaited()
+
+
 @pytest.mark.parametrize(
     ("webfsapi_endpoint_error", "result_error"),
     [(ValueError, "unknown"), (ConnectionError, "cannot_connect")],
@@ -341,6 +574,36 @@ async def test_ssdp_fail(
     assert result["reason"] == result_error
 
 
+async def test_ssdp_device_unreachable(hass: HomeAssistant) -> None:
+    """Test a discovered device that stops responding after its endpoint lookup."""
+    with patch(
+        "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_friendly_name",
+        side_effect=ConnectionError,
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": config_entries.SOURCE_SSDP},
+            data=MOCK_DISCOVERY,
+        )
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "cannot_connect"
+
+    with patch(
+        "homeassistant.components.frontier_silicon.config_flow.AFSAPI.get_webfsapi_endpoint",
+        return_value=WEBFSAPI_URL,
+    ) as mock_get_webfsapi_endpoint:
+        result2 = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": config_entries.SOURCE_SSDP},
+            data=MOCK_DISCOVERY,
+        )
+
+    assert result2["type"] is FlowResultType.FORM
+    assert result2["step_id"] == "confirm"
+    mock_get_webfsapi_endpoint.assert_called_once_with(MOCK_DISCOVERY.ssdp_location)
+
+
 async def test_ssdp_nondefault_pin(hass: HomeAssistant) -> None:
     """Test a device being discovered."""
 
@@ -406,7 +669,6 @@ async def test_reauth_flow_friendly_name_error(
             result["flow_id"],
             {CONF_PIN: "4321"},
         )
-        await hass.async_block_till_done()
 
     assert result2["type"] is FlowResultType.FORM
     assert result2["step_id"] == "device_config"
@@ -61,7 +61,7 @@ TEST_DEVICE_SERVICE_INFO = BluetoothServiceInfo(
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EntityTestInfo:
     """Describes how we expected an entity to be created by homekit_controller."""
 
@@ -75,7 +75,7 @@ class EntityTestInfo:
     unit_of_measurement: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceTriggerInfo:
     """Describe a automation trigger we expect to be created.
 
@@ -86,7 +86,7 @@ class DeviceTriggerInfo:
     subtype: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceTestInfo:
     """Describes how we exepced a device to be created by homekit_controlller."""
 
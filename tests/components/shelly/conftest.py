@@ -305,6 +305,24 @@ def mock_ws_server():
         yield
 
 
+@pytest.fixture
+def mock_setup():
+    """Mock out integration setup."""
+    with patch(
+        "homeassistant.components.shelly.async_setup", return_value=True
+    ) as mock_setup:
+        yield mock_setup
+
+
+@pytest.fixture
+def mock_setup_entry():
+    """Mock out config entry setup."""
+    with patch(
+        "homeassistant.components.shelly.async_setup_entry", return_value=True
+    ) as mock_setup_entry:
+        yield mock_setup_entry
+
+
 @pytest.fixture
 def events(hass: HomeAssistant):
     """Yield caught shelly_click events."""
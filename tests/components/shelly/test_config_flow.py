@@ -68,6 +68,8 @@ async def test_form(
     port: int,
     mock_block_device: Mock,
     mock_rpc_device: Mock,
+    mock_setup: AsyncMock,
+    mock_setup_entry: AsyncMock,
 ) -> None:
     """Test we get the form."""
     result = await hass.config_entries.flow.async_init(
@@ -76,24 +78,15 @@ async def test_form(
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {}
 
-    with (
-        patch(
-            "homeassistant.components.shelly.config_flow.get_info",
-            return_value={
-                "mac": "test-mac",
-                "type": MODEL_1,
-                "auth": False,
-                "gen": gen,
-                "port": port,
-            },
-        ),
-        patch(
-            "homeassistant.components.shelly.async_setup", return_value=True
-        ) as mock_setup,
-        patch(
-            "homeassistant.components.shelly.async_setup_entry",
-            return_value=True,
-        ) as mock_setup_entry,
+    with patch(
+        "homeassistant.components.shelly.config_flow.get_info",
+        return_value={
+            "mac": "test-mac",
+            "type": MODEL_1,
+            "auth": False,
+            "gen": gen,
+            "port": port,
+        },
     ):
         result2 = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -175,6 +168,8 @@ async def test_form_auth(
     username: str,
     mock_block_device: Mock,
     mock_rpc_device: Mock,
+    mock_setup: AsyncMock,
+    mock_setup_entry: AsyncMock,
 ) -> None:
     """Test manual configuration if auth is required."""
     result = await hass.config_entries.flow.async_init(
@@ -195,19 +190,10 @@ async def test_form_auth(
     assert result2["type"] is FlowResultType.FORM
     assert result["errors"] == {}
 
-    with (
-        patch(
-            "homeassistant.components.shelly.async_setup", return_value=True
-        ) as mock_setup,
-        patch(
-            "homeassistant.components.shelly.async_setup_entry",
-            return_value=True,
-        ) as mock_setup_entry,
-    ):
-        result3 = await hass.config_entries.flow.async_configure(
-            result2["flow_id"], user_input
-        )
-        await hass.async_block_till_done()
+    result3 = await hass.config_entries.flow.async_configure(
+        result2["flow_id"], user_input
+    )
+    await hass.async_block_till_done()
 
     assert result3["type"] is FlowResultType.CREATE_ENTRY
     assert result3["title"] == "Test name"
@@ -389,7 +375,10 @@ async def test_form_already_configured(hass: HomeAssistant) -> None:
 
 
 async def test_user_setup_ignored_device(
-    hass: HomeAssistant, mock_block_device: Mock
+    hass: HomeAssistant,
+    mock_block_device: Mock,
+    mock_setup: AsyncMock,
+    mock_setup_entry: AsyncMock,
 ) -> None:
     """Test user can successfully setup an ignored device."""
 
@@ -405,18 +394,9 @@ async def test_user_setup_ignored_device(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
 
-    with (
-        patch(
-            "homeassistant.components.shelly.config_flow.get_info",
-            return_value={"mac": "test-mac", "type": MODEL_1, "auth": False},
-        ),
-        patch(
-            "homeassistant.components.shelly.async_setup", return_value=True
-        ) as mock_setup,
-        patch(
-            "homeassistant.components.shelly.async_setup_entry",
-            return_value=True,
-        ) as mock_setup_entry,
+    with patch(
+        "homeassistant.components.shelly.config_flow.get_info",
+        return_value={"mac": "test-mac", "type": MODEL_1, "auth": False},
     ):
         result2 = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -531,6 +511,8 @@ async def test_zeroconf(
     get_info: dict[str, Any],
     mock_block_device: Mock,
     mock_rpc_device: Mock,
+    mock_setup: AsyncMock,
+    mock_setup_entry: AsyncMock,
 ) -> None:
     """Test we get the form."""
 
@@ -551,20 +533,11 @@ async def test_zeroconf(
         )
         assert context["title_placeholders"]["name"] == "shelly1pm-12345"
         assert context["confirm_only"] is True
-    with (
-        patch(
-            "homeassistant.components.shelly.async_setup", return_value=True
-        ) as mock_setup,
-        patch(
-            "homeassistant.components.shelly.async_setup_entry",
-            return_value=True,
-        ) as mock_setup_entry,
-    ):
-        result2 = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {},
-        )
-        await hass.async_block_till_done()
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {},
+    )
+    await hass.async_block_till_done()
 
     assert result2["type"] is FlowResultType.CREATE_ENTRY
     assert result2["title"] == "Test name"
@@ -579,7 +552,11 @@ async def test_zeroconf(
 
 
 async def test_zeroconf_sleeping_device(
-    hass: HomeAssistant, mock_block_device: Mock, monkeypatch: pytest.MonkeyPatch
+    hass: HomeAssistant,
+    mock_block_device: Mock,
+    mock_setup: AsyncMock,
+    mock_setup_entry: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test sleeping device configuration via zeroconf."""
     monkeypatch.setitem(
@@ -609,20 +586,11 @@ async def test_zeroconf_sleeping_device(
             if flow["flow_id"] == result["flow_id"]
         )
         assert context["title_placeholders"]["name"] == "shelly1pm-12345"
-    with (
-        patch(
-            "homeassistant.components.shelly.async_setup", return_value=True
-        ) as mock_setup,
-        patch(
-            "homeassistant.components.shelly.async_setup_entry",
-            return_value=True,
-        ) as mock_setup_entry,
-    ):
-        result2 = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {},
-        )
-        await hass.async_block_till_done()
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {},
+    )
+    await hass.async_block_till_done()
 
     assert result2["type"] is FlowResultType.CREATE_ENTRY
     assert result2["title"] == "Test name"
@@ -752,7 +720,10 @@ async def test_zeroconf_cannot_connect(hass: HomeAssistant) -> None:
 
 
 async def test_zeroconf_require_auth(
-    hass: HomeAssistant, mock_block_device: Mock
+    hass: HomeAssistant,
+    mock_block_device: Mock,
+    mock_setup: AsyncMock,
+    mock_setup_entry: AsyncMock,
 ) -> None:
     """Test zeroconf if auth is required."""
 
@@ -768,20 +739,11 @@ async def test_zeroconf_require_auth(
         assert result["type"] is FlowResultType.FORM
         assert result["errors"] == {}
 
-    with (
-        patch(
-            "homeassistant.components.shelly.async_setup", return_value=True
-        ) as mock_setup,
-        patch(
-            "homeassistant.components.shelly.async_setup_entry",
-            return_value=True,
-        ) as mock_setup_entry,
-    ):
-        result2 = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {"username": "test username", "password": "test password"},
-        )
-        await hass.async_block_till_done()
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {"username": "test username", "password": "test password"},
+    )
+    await hass.async_block_till_done()
 
     assert result2["type"] is FlowResultType.CREATE_ENTRY
     assert result2["title"] == "Test name"
@@ -1311,6 +1273,7 @@ async def test_zeroconf_sleeping_device_attempts_configure_no_url_available(
     assert mock_rpc_device.update_outbound_websocket.mock_calls == []
 
 
+@pytest.mark.usefixtures("mock_setup", "mock_setup_entry")
 async def test_sleeping_device_gen2_with_new_firmware(
     hass: HomeAssistant, mock_rpc_device: Mock, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -1322,16 +1285,9 @@ async def test_sleeping_device_gen2_with_new_firmware(
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {}
 
-    with (
-        patch(
-            "homeassistant.components.shelly.config_flow.get_info",
-            return_value={"mac": "test-mac", "gen": 2},
-        ),
-        patch("homeassistant.components.shelly.async_setup", return_value=True),
-        patch(
-            "homeassistant.components.shelly.async_setup_entry",
-            return_value=True,
-        ),
+    with patch(
+        "homeassistant.components.shelly.config_flow.get_info",
+        return_value={"mac": "test-mac", "gen": 2},
     ):
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
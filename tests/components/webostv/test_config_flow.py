@@ -1,7 +1,6 @@
 """Test the WebOS Tv config flow."""
 
 import dataclasses
-from unittest.mock import Mock
 
 from aiowebostv import WebOsTvPairError
 import pytest
@@ -37,13 +36,10 @@ MOCK_DISCOVERY_INFO = ssdp.SsdpServiceInfo(
 
 async def test_form(hass: HomeAssistant, client) -> None:
     """Test we get the form."""
-    assert client
-
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={CONF_SOURCE: config_entries.SOURCE_USER},
     )
-    await hass.async_block_till_done()
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "user"
@@ -53,17 +49,6 @@ async def test_form(hass: HomeAssistant, client) -> None:
         context={CONF_SOURCE: config_entries.SOURCE_USER},
         data=MOCK_USER_CONFIG,
     )
-    await hass.async_block_till_done()
-
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "pairing"
-
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={CONF_SOURCE: config_entries.SOURCE_USER},
-        data=MOCK_USER_CONFIG,
-    )
-    await hass.async_block_till_done()
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "pairing"
@@ -104,7 +89,6 @@ async def test_options_flow_live_tv_in_apps(
     entry = await setup_webostv(hass)
 
     result = await hass.config_entries.options.async_init(entry.entry_id)
-    await hass.async_block_till_done()
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "init"
@@ -123,9 +107,8 @@ async def test_options_flow_cannot_retrieve(hass: HomeAssistant, client) -> None
     """Test options config flow cannot retrieve sources."""
     entry = await setup_webostv(hass)
 
-    client.connect = Mock(side_effect=ConnectionRefusedError())
+    client.connect.side_effect = ConnectionRefusedError()
     result = await hass.config_entries.options.async_init(entry.entry_id)
-    await hass.async_block_till_done()
 
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {"base": "cannot_retrieve"}
@@ -139,11 +122,10 @@ async def test_form_cannot_connect(hass: HomeAssistant, client) -> None:
         data=MOCK_USER_CONFIG,
     )
 
-    client.connect = Mock(side_effect=ConnectionRefusedError())
+    client.connect.side_effect = ConnectionRefusedError()
     result2 = await hass.config_entries.flow.async_configure(
         result["flow_id"], user_input={}
     )
-    await hass.async_block_till_done()
 
     assert result2["type"] is FlowResultType.FORM
     assert result2["errors"] == {"base": "cannot_connect"}
@@ -157,11 +139,10 @@ async def test_form_pairexception(hass: HomeAssistant, client) -> None:
         data=MOCK_USER_CONFIG,
     )
 
-    client.connect = Mock(side_effect=WebOsTvPairError("error"))
+    client.connect.side_effect = WebOsTvPairError("error")
     result2 = await hass.config_entries.flow.async_configure(
         result["flow_id"], user_input={}
     )
-    await hass.async_block_till_done()
 
     assert result2["type"] is FlowResultType.ABORT
     assert result2["reason"] == "error_pairing"
@@ -170,7 +151,6 @@ async def test_form_pairexception(hass: HomeAssistant, client) -> None:
 async def test_entry_already_configured(hass: HomeAssistant, client) -> None:
     """Test entry already configured."""
     await setup_webostv(hass)
-    assert client
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
@@ -184,12 +164,9 @@ async def test_entry_already_configured(hass: HomeAssistant, client) -> None:
 
 async def test_form_ssdp(hass: HomeAssistant, client) -> None:
     """Test that the ssdp confirmation form is served."""
-    assert client
-
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={CONF_SOURCE: SOURCE_SSDP}, data=MOCK_DISCOVERY_INFO
     )
-    await hass.async_block_till_done()
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "pairing"
@@ -197,14 +174,11 @@ async def test_form_ssdp(hass: HomeAssistant, client) -> None:
 
 async def test_ssdp_in_progress(hass: HomeAssistant, client) -> None:
     """Test abort if ssdp paring is already in progress."""
-    assert client
-
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={CONF_SOURCE: config_entries.SOURCE_USER},
         data=MOCK_USER_CONFIG,
     )
-    await hass.async_block_till_done()
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "pairing"
@@ -212,7 +186,6 @@ async def test_ssdp_in_progress(hass: HomeAssistant, client) -> None:
     result2 = await hass.config_entries.flow.async_init(
         DOMAIN, context={CONF_SOURCE: SOURCE_SSDP}, data=MOCK_DISCOVERY_INFO
     )
-    await hass.async_block_till_done()
 
     assert result2["type"] is FlowResultType.ABORT
     assert result2["reason"] == "already_in_progress"
@@ -221,13 +194,11 @@ async def test_ssdp_in_progress(hass: HomeAssistant, client) -> None:
 async def test_ssdp_update_uuid(hass: HomeAssistant, client) -> None:
     """Test that ssdp updates existing host entry uuid."""
     entry = await setup_webostv(hass, None)
-    assert client
     assert entry.unique_id is None
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={CONF_SOURCE: SOURCE_SSDP}, data=MOCK_DISCOVERY_INFO
     )
-    await hass.async_block_till_done()
 
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == "already_configured"
@@ -237,16 +208,15 @@ async def test_ssdp_update_uuid(hass: HomeAssistant, client) -> None:
 async def test_ssdp_not_update_uuid(hass: HomeAssistant, client) -> None:
     """Test that ssdp not updates different host."""
     entry = await setup_webostv(hass, None)
-    assert client
     assert entry.unique_id is None
 
-    discovery_info = dataclasses.replace(MOCK_DISCOVERY_INFO)
-    discovery_info.ssdp_location = "http://1.2.3.5"
+    discovery_info = dataclasses.replace(
+        MOCK_DISCOVERY_INFO, ssdp_location="http://1.2.3.5"
+    )
 
     result2 = await hass.config_entries.flow.async_init(
         DOMAIN, context={CONF_SOURCE: SOURCE_SSDP}, data=discovery_info
     )
-    await hass.async_block_till_done()
 
     assert result2["type"] is FlowResultType.FORM
     assert result2["step_id"] == "pairing"
@@ -256,19 +226,9 @@ async def test_ssdp_not_update_uuid(hass: HomeAssistant, client) -> None:
 async def test_form_abort_uuid_configured(hass: HomeAssistant, client) -> None:
     """Test abort if uuid is already configured, verify host update."""
     entry = await setup_webostv(hass, MOCK_DISCOVERY_INFO.upnp[ssdp.ATTR_UPNP_UDN][5:])
-    assert client
     assert entry.unique_id == MOCK_DISCOVERY_INFO.upnp[ssdp.ATTR_UPNP_UDN][5:]
     assert entry.data[CONF_HOST] == HOST
 
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={CONF_SOURCE: config_entries.SOURCE_USER},
-    )
-    await hass.async_block_till_done()
-
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "user"
-
     user_config = {
         CONF_HOST: "new_host",
         CONF_NAME: TV_NAME,
@@ -279,7 +239,6 @@ async def test_form_abort_uuid_configured(hass: HomeAssistant, client) -> None:
         context={CONF_SOURCE: config_entries.SOURCE_USER},
         data=user_config,
     )
-    await hass.async_block_till_done()
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "pairing"
@@ -300,7 +259,6 @@ async def test_reauth_successful(
 ) -> None:
     """Test that the reauthorization is successful."""
     entry = await setup_webostv(hass)
-    assert client
 
     result = await entry.start_reauth_flow(hass)
     assert result["step_id"] == "reauth_confirm"
@@ -328,12 +286,9 @@ async def test_reauth_successful(
         (ConnectionRefusedError, "reauth_unsuccessful"),
     ],
 )
-async def test_reauth_errors(
-    hass: HomeAssistant, client, monkeypatch: pytest.MonkeyPatch, side_effect, reason
-) -> None:
+async def test_reauth_errors(hass: HomeAssistant, client, side_effect, reason) -> None:
     """Test reauthorization errors."""
     entry = await setup_webostv(hass)
-    assert client
 
     result = await entry.start_reauth_flow(hass)
     assert result["step_id"] == "reauth_confirm"
@@ -343,7 +298,7 @@ async def test_reauth_errors(
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "reauth_confirm"
 
-    monkeypatch.setattr(client, "connect", Mock(side_effect=side_effect))
+    client.connect.side_effect = side_effect
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"], user_input={}
     )